@@ -7,60 +7,323 @@ Usage: python upload.py <file_path> <resource_name>
 import os
 import sys
 import json
+import base64
+import functools
+import hashlib
+import hmac
+import itertools
+import mmap
+import queue
+import selectors
+import socket
+import threading
 import time
 import mimetypes
-from typing import List, Dict, Any, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Iterator, Optional, Set
+from urllib.parse import urlparse
 import requests
-import jwt
+from requests.adapters import HTTPAdapter
+from requests.utils import get_environ_proxies, select_proxy
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configuration
 CHUNK_SIZE = 5 * 1024 * 1024  # 5MB - must match server
 CONFIG_FILE = "upload_config.json"
+DEFAULT_CONCURRENCY = 4  # Parts uploaded in parallel; the worker accepts them in any order
+PREFETCH_PARTS = 2  # Parts paged in ahead of the one being submitted
+HAS_MADVISE = hasattr(mmap.mmap, "madvise")  # Readahead hints are Unix-only
+READ_AHEAD_PARTS = 2  # Parts buffered ahead of the uploaders when the file cannot be mapped
+PROGRESS_INTERVAL = 0.5  # Seconds between progress reports while uploading
+# Transient failures retried per request (with exponential backoff) before the upload is aborted.
+# 422 is the worker rejecting a part whose checksum did not match, so the part is resent.
+MAX_RETRIES = 5
+RETRY_STATUS_CODES = frozenset({408, 422, 429, 500, 502, 503, 504})
+REQUEST_TIMEOUT = (10, 60)  # Connect and read timeouts in seconds, so a stalled request is retried
+JWT_LIFETIME = 3600  # 1 hour expiration
+JWT_REFRESH_MARGIN = 60  # Re-sign cached backend tokens this close to expiry
+
+# Types of the files usually stored, so the system MIME database is only loaded for anything else
+MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+    ".svg": "image/svg+xml",
+    ".ico": "image/vnd.microsoft.icon",
+    ".mp4": "video/mp4",
+    ".webm": "video/webm",
+    ".mov": "video/quicktime",
+    ".mp3": "audio/mpeg",
+    ".ogg": "audio/ogg",
+    ".wav": "audio/wav",
+    ".pdf": "application/pdf",
+    ".zip": "application/zip",
+    ".json": "application/json",
+    ".txt": "text/plain",
+    ".html": "text/html",
+    ".css": "text/css",
+    ".js": "text/javascript",
+}
+
+@functools.lru_cache(maxsize=256)
+def _guess_mime_type(file_name: str) -> str:
+    """Guess the MIME type for a file name"""
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension in MIME_TYPES:
+        return MIME_TYPES[extension]
+    # mimetypes also handles compound suffixes such as .tar.gz
+    mime_type, _ = mimetypes.guess_type(file_name)
+    return mime_type or "application/octet-stream"
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a configuration file, once per path and modification time"""
+    with open(config_path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding, as used by JWT"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# The JOSE header never changes, so its encoded segment is computed once
+JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
 
 class UploadError(Exception):
     """Custom exception for upload errors"""
     pass
 
+class UploadProgress:
+    """Progress reporter shared by the part upload workers
+    
+    Workers only add to a byte counter; a background thread prints it every
+    `interval` seconds while the reporter is entered, and once more on exit.
+    """
+    
+    def __init__(self, total_bytes: int, interval: float = PROGRESS_INTERVAL):
+        self.total_bytes = total_bytes
+        self.interval = interval
+        self._uploaded_bytes = 0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._report_loop, daemon=True)
+    
+    def __enter__(self) -> "UploadProgress":
+        self._thread.start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._done.set()
+        self._thread.join()
+    
+    def add(self, num_bytes: int):
+        """Record bytes of a part that finished uploading"""
+        with self._lock:
+            self._uploaded_bytes += num_bytes
+    
+    def _report(self):
+        uploaded_bytes = self._uploaded_bytes
+        progress = (uploaded_bytes / self.total_bytes) * 100
+        sys.stdout.write(f"\rProgress: {progress:.1f}% ({uploaded_bytes}/{self.total_bytes} bytes)")
+        sys.stdout.flush()
+    
+    def _report_loop(self):
+        while not self._done.wait(self.interval):
+            self._report()
+        self._report()
+        sys.stdout.write("\n")
+
+class FileRange:
+    """A byte range of an open file descriptor, used as a request body that is sent with sendfile()"""
+    
+    def __init__(self, fd: int, offset: int, size: int):
+        self.fd = fd
+        self.offset = offset
+        self.size = size
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self):
+        # The HTTP client sends an iterable body chunk by chunk; the range is its only chunk
+        return iter((self,))
+    
+    def send_to(self, sock: socket.socket):
+        """Copy the range to the socket in the kernel
+        
+        Offsets are passed explicitly, so workers can share one descriptor.
+        """
+        offset, remaining = self.offset, self.size
+        timeout = sock.gettimeout()
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_WRITE)
+            while remaining:
+                if timeout and not selector.select(timeout):
+                    raise socket.timeout("timed out")
+                try:
+                    sent = os.sendfile(sock.fileno(), self.fd, offset, remaining)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    if offset != self.offset:
+                        raise
+                    # The filesystem does not support sendfile(), so read the range explicitly
+                    sock.sendall(os.pread(self.fd, remaining, offset))
+                    return
+                if sent == 0:
+                    raise UploadError("File was truncated while uploading")
+                offset += sent
+                remaining -= sent
+
+class SendfileHTTPConnection(HTTPConnection):
+    """Plain HTTP connection that hands FileRange bodies to the kernel with sendfile()"""
+    
+    def send(self, data):
+        if isinstance(data, FileRange):
+            if self.sock is None:
+                self.connect()
+            data.send_to(self.sock)
+        else:
+            super().send(data)
+
+class SendfileHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = SendfileHTTPConnection
+
+class UploadHTTPAdapter(HTTPAdapter):
+    """Transport adapter tuned for large uploads
+    
+    Plain HTTP connections support FileRange bodies. Sockets keep urllib3's defaults
+    (TCP_NODELAY on) unless `send_buffer_size` is given, which pins SO_SNDBUF.
+    """
+    
+    __attrs__ = HTTPAdapter.__attrs__ + ["send_buffer_size"]
+    
+    def __init__(self, send_buffer_size: Optional[int] = None, **kwargs):
+        # Set before HTTPAdapter.__init__, which creates the pool manager
+        self.send_buffer_size = send_buffer_size
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        if self.send_buffer_size:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+            ]
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            **self.poolmanager.pool_classes_by_scheme,
+            "http": SendfileHTTPConnectionPool
+        }
+
 class MultipartUploader:
     def __init__(self, config_path: str = CONFIG_FILE):
         """Initialize the uploader with configuration"""
         self.config = self._load_config(config_path)
         self.base_url = self.config["worker_url"].rstrip("/")
         self.jwt_secret = self.config["jwt_secret"]
+        self.concurrency = max(1, int(self.config.get("concurrency", DEFAULT_CONCURRENCY)))
+        self.part_checksums = bool(self.config.get("part_checksums", True))
+        # Optional fixed SO_SNDBUF in bytes. On Linux this disables send buffer autotuning
+        # (tcp_wmem) and is capped at net.core.wmem_max, which must be raised to match;
+        # leave it unset to let the kernel size the buffer.
+        self.send_buffer_size = self.config.get("send_buffer_size")
+        # TLS needs the bytes in userspace, so only plain HTTP parts can skip the copy
+        # Proxied requests go through the adapter's stock proxy pools, which cannot send FileRange bodies
+        self.use_sendfile = (
+            urlparse(self.base_url).scheme == "http"
+            and hasattr(os, "sendfile")
+            and select_proxy(self.base_url, get_environ_proxies(self.base_url)) is None
+        )
+        self._jwt_hmac = hmac.new(self.jwt_secret.encode(), digestmod=hashlib.sha256)
+        self._jwt_cache: Dict[str, tuple[str, int]] = {}
+        
+        # One session for every call so connections are kept alive across parts
+        self._session = requests.Session()
+        adapter = UploadHTTPAdapter(send_buffer_size=self.send_buffer_size, pool_connections=1, pool_maxsize=self.concurrency, max_retries=Retry(
+            total=MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=RETRY_STATUS_CODES,
+            # Creating or completing an upload is not idempotent, so only these are retried
+            allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        ))
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+    
+    def __enter__(self) -> "MultipartUploader":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._session.close()
         
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file"""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            # Keyed on mtime so an edited file is picked up by the next uploader
+            return dict(_load_config_cached(config_path, os.stat(config_path).st_mtime_ns))
         except FileNotFoundError:
             raise UploadError(f"Configuration file {config_path} not found")
         except json.JSONDecodeError:
             raise UploadError(f"Invalid JSON in configuration file {config_path}")
     
     def _generate_backend_jwt(self, action: str) -> str:
-        """Generate JWT token for backend operations"""
+        """Generate JWT token for backend operations, reusing a cached one until close to expiry"""
+        now = int(time.time())
+        cached = self._jwt_cache.get(action)
+        if cached and cached[1] - now > JWT_REFRESH_MARGIN:
+            return cached[0]
+        
+        exp = now + JWT_LIFETIME
         payload = {
             "type": "backend",
             "action": action,
-            "iat": int(time.time()) - 60,
-            "exp": int(time.time()) + 3600  # 1 hour expiration
+            "iat": now - 60,
+            "exp": exp
         }
-        return jwt.encode(payload, self.jwt_secret, algorithm="HS256")
+        token = self._sign_jwt(payload)
+        self._jwt_cache[action] = (token, exp)
+        return token
+    
+    def _sign_jwt(self, payload: Dict[str, Any]) -> str:
+        """Encode and sign an HS256 JWT"""
+        if orjson is not None:
+            payload_json = orjson.dumps(payload)
+        else:
+            payload_json = json.dumps(payload, separators=(",", ":")).encode()
+        signing_input = JWT_HEADER_B64 + b"." + _b64url(payload_json)
+        
+        # Copying the keyed HMAC skips re-deriving the padded key on every token
+        signer = self._jwt_hmac.copy()
+        signer.update(signing_input)
+        return (signing_input + b"." + _b64url(signer.digest())).decode()
     
     def _get_file_info(self, file_path: str) -> tuple[int, str]:
         """Get file size and MIME type"""
-        if not os.path.exists(file_path):
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
             raise UploadError(f"File not found: {file_path}")
         
-        file_size = os.path.getsize(file_path)
-        mime_type, _ = mimetypes.guess_type(file_path)
-        
-        if mime_type is None:
-            mime_type = "application/octet-stream"
+        mime_type = _guess_mime_type(os.path.basename(file_path))
         
-        return file_size, mime_type
+        return st.st_size, mime_type
     
     def _make_request(self, method: str, endpoint: str, token: str, **kwargs) -> requests.Response:
         """Make HTTP request with proper error handling"""
@@ -71,10 +334,15 @@ class MultipartUploader:
         }
         kwargs["headers"] = headers
         
+        return self._send(method, url, **kwargs)
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with ready-made headers, with proper error handling"""
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
         error = None
         
         try:
-            response = requests.request(method, url, **kwargs)
+            response = self._session.request(method, url, **kwargs)
             body = response.json()
             if not body.get("success"):
                 error = body.get("error")
@@ -106,47 +374,173 @@ class MultipartUploader:
         
         return data
     
-    def upload_file_parts(self, file_path: str, client_token: str, upload_info: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Upload file in chunks using the client token"""
+    def _upload_part(self, chunk: Optional[memoryview], source: Optional[int], part_number: int, offset: int,
+                     size: int, url: str, headers: Dict[str, str], progress: UploadProgress) -> Dict[str, Any]:
+        """Upload the bytes at the given offset as one part
+        
+        The body is `chunk`, or a range of the `source` descriptor sent with sendfile()
+        when the upload goes over plain HTTP. `chunk` may then be None if no checksum is needed.
+        """
+        try:
+            if self.part_checksums:
+                # hashlib hands the digest to OpenSSL, which uses SHA extensions where available
+                headers = {**headers, "X-Content-SHA256": hashlib.sha256(chunk).hexdigest()}
+            
+            response = self._send(
+                "PUT", 
+                url, 
+                data=chunk if source is None else FileRange(source, offset, size),
+                headers=headers
+            )
+        finally:
+            # The view must be released before the map can be closed
+            if chunk is not None:
+                chunk.release()
+        
+        part_data = response.json()
+        if not part_data.get("success"):
+            raise UploadError(f"Failed to upload part {part_number}: {part_data.get('error')}")
+        
+        progress.add(size)
+        return part_data
+    
+    def _map_file(self, file_path: str) -> mmap.mmap:
+        """Map the file read-only and start paging in the first parts
+        
+        Raises OSError or ValueError when the file cannot be mapped, e.g. on filesystems
+        without mmap support.
+        """
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            # The map holds its own reference to the file
+            os.close(fd)
+        if HAS_MADVISE:
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            mm.madvise(mmap.MADV_WILLNEED, 0, PREFETCH_PARTS * CHUNK_SIZE)
+        return mm
+    
+    def _map_fallback(self, file_path: str, error: BaseException):
+        """Report a failed map on the calling thread, re-raising anything but a mapping failure"""
+        if not isinstance(error, (OSError, ValueError)):
+            raise error
+        print(f"Cannot map {file_path} ({error}), falling back to buffered reads")
+    
+    def _read_ahead(self, file_path: str, chunks: List[tuple[int, int, int, str]]) -> Iterator[bytes]:
+        """Yield part contents in order, read by a background thread up to READ_AHEAD_PARTS ahead
+        
+        Used when the file cannot be mapped, so disk reads still overlap with part uploads.
+        """
+        buffered: queue.Queue = queue.Queue(maxsize=READ_AHEAD_PARTS)
+        stop = threading.Event()
+        
+        def reader():
+            try:
+                # Parts are consecutive and this is the only reader, so plain sequential reads suffice
+                with open(file_path, 'rb') as f:
+                    for _, _, size, _ in chunks:
+                        if stop.is_set():
+                            return
+                        buffered.put(f.read(size))
+            except OSError as e:
+                buffered.put(e)
+        
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        try:
+            for _ in chunks:
+                item = buffered.get()
+                if isinstance(item, OSError):
+                    raise UploadError(f"Failed to read {file_path}: {item}")
+                yield item
+        finally:
+            # Unblock the reader if the upload stopped early
+            stop.set()
+            while thread.is_alive():
+                try:
+                    buffered.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+    
+    def upload_file_parts(self, file_path: str, client_token: str, upload_info: Dict[str, Any],
+                          file_map: Optional[mmap.mmap] = None, map_attempted: bool = False) -> List[Dict[str, Any]]:
+        """Upload file in chunks using the client token, `concurrency` parts at a time
+        
+        Parts are sent straight from a read-only map of the file, or read ahead on a
+        background thread if it cannot be mapped. Pass `file_map` to reuse an existing
+        map; the caller then remains responsible for closing it. Pass `map_attempted`
+        when the caller already tried to map the file, so a failed map is not retried.
+        """
         total_parts = upload_info["totalParts"]
-        parts = []
+        # Shared by every part request, so they are built once rather than per part
+        headers = {
+            "Authorization": f"Bearer {client_token}",
+            "Content-Type": "application/octet-stream"
+        }
+        etags: Dict[int, str] = {}
         
-        print(f"Starting upload of {total_parts} parts...")
+        print(f"Starting upload of {total_parts} parts ({self.concurrency} concurrent)...")
         
-        with open(file_path, 'rb') as f:
-            for part_number in range(1, total_parts + 1):
-                chunk = f.read(CHUNK_SIZE)
-                if not chunk:
-                    break
-                
-                is_last_part = part_number == total_parts
-                print(f"Uploading part {part_number}/{total_parts} ({len(chunk)} bytes)")
-                
-                # Upload part
-                endpoint = f"/upload/part/{part_number}"
-                if is_last_part:
-                    endpoint += "?isLast=true"
-                
-                response = self._make_request(
-                    "PUT", 
-                    endpoint, 
-                    client_token,
-                    data=chunk,
-                    headers={"Content-Type": "application/octet-stream"}
-                )
-                
-                part_data = response.json()
-                if not part_data.get("success"):
-                    raise UploadError(f"Failed to upload part {part_number}: {part_data.get('error')}")
-                
-                parts.append({
-                    "partNumber": part_data["partNumber"],
-                    "etag": part_data["etag"]
-                })
-                
-                # Show progress
-                progress = (part_data["uploadedBytes"] / part_data["totalBytes"]) * 100
-                print(f"Progress: {progress:.1f}% ({part_data['uploadedBytes']}/{part_data['totalBytes']} bytes)")
+        mm = file_map
+        if mm is None and not map_attempted:
+            try:
+                mm = self._map_file(file_path)
+            except (OSError, ValueError) as e:
+                self._map_fallback(file_path, e)
+        source = os.open(file_path, os.O_RDONLY) if self.use_sendfile else None
+        reader = None
+        try:
+            file_size = len(mm) if mm is not None else os.path.getsize(file_path)
+            last_size = file_size - (total_parts - 1) * CHUNK_SIZE
+            if not 0 < last_size <= CHUNK_SIZE:
+                raise UploadError(f"File size {file_size} does not match {total_parts} parts of {CHUNK_SIZE} bytes")
+            
+            # Every part is full-sized except the last, which is also the only one flagged
+            part_url = f"{self.base_url}/upload/part/"
+            chunks = [
+                (part_number, (part_number - 1) * CHUNK_SIZE, CHUNK_SIZE, part_url + str(part_number))
+                for part_number in range(1, total_parts)
+            ]
+            chunks.append((total_parts, (total_parts - 1) * CHUNK_SIZE, last_size, part_url + str(total_parts) + "?isLast=true"))
+            
+            # Keep at most `concurrency` parts in flight, topping the window up as
+            # parts finish, so a failed part only waits on the ones already running
+            remaining = iter(chunks)
+            pending: Set[Future] = set()
+            # With sendfile() and no checksums, unmapped parts never need to be read here
+            if mm is None and (source is None or self.part_checksums):
+                reader = self._read_ahead(file_path, chunks)
+            with UploadProgress(file_size) as progress, ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                while True:
+                    for part_number, offset, size, url in itertools.islice(remaining, self.concurrency - len(pending)):
+                        if mm is not None:
+                            # Ask the kernel to read ahead so workers do not stall on page faults
+                            prefetch_offset = offset + PREFETCH_PARTS * CHUNK_SIZE
+                            if HAS_MADVISE and prefetch_offset < file_size:
+                                mm.madvise(mmap.MADV_WILLNEED, prefetch_offset, CHUNK_SIZE)
+                            chunk = memoryview(mm)[offset:offset + size]
+                        elif reader is not None:
+                            chunk = memoryview(next(reader))
+                        else:
+                            chunk = None
+                        pending.add(executor.submit(self._upload_part, chunk, source, part_number, offset, size, url, headers, progress))
+                    if not pending:
+                        break
+                    
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        part_data = future.result()
+                        etags[part_data["partNumber"]] = part_data["etag"]
+        finally:
+            if reader is not None:
+                reader.close()
+            if source is not None:
+                os.close(source)
+            if file_map is None and mm is not None:
+                mm.close()
+        
+        parts = [{"partNumber": part_number, "etag": etags[part_number]} for part_number in sorted(etags)]
         
         print("All parts uploaded successfully!")
         return parts
@@ -203,36 +597,50 @@ class MultipartUploader:
             print(f"Size: {file_size} bytes ({file_size / (1024*1024):.2f} MB)")
             print(f"MIME type: {mime_type}")
             
-            # Create upload
-            upload_info = self.create_upload(resource_name, file_size, mime_type)
-            client_token = upload_info["clientToken"]
-            upload_id = upload_info["uploadId"]
+            # Create upload while the file is mapped and its first part paged in
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                map_future = pool.submit(self._map_file, file_path)
+                create_future = pool.submit(self.create_upload, resource_name, file_size, mime_type)
             
+            map_error = map_future.exception()
+            file_map = map_future.result() if map_error is None else None
             try:
-                # Upload parts
-                parts = self.upload_file_parts(file_path, client_token, upload_info)
-                
-                # Complete upload
-                completion_info = self.complete_upload(upload_id, resource_name, parts)
-                
-                # Generate file URL
-                file_url = f"{self.base_url}/file/{resource_name}"
-                
-                elapsed_time = time.time() - start_time
-                print(f"\n✅ Upload successful!")
-                print(f"Resource name: {resource_name}")
-                print(f"File URL: {file_url}")
-                print(f"ETag: {completion_info['etag']}")
-                print(f"Size: {completion_info['size']} bytes")
-                print(f"Upload time: {elapsed_time:.2f} seconds")
-                print(f"Average speed: {(file_size / elapsed_time) / (1024*1024):.2f} MB/s")
-                
-                return file_url
+                upload_info = create_future.result()
+                client_token = upload_info["clientToken"]
+                upload_id = upload_info["uploadId"]
                 
-            except Exception as e:
-                print(f"Error: {e}")
-                self.abort_upload(upload_id, resource_name)
-                raise
+                try:
+                    if map_error is not None:
+                        # Reported only now, so it cannot interleave with create_upload's output
+                        self._map_fallback(file_path, map_error)
+                    
+                    # Upload parts
+                    parts = self.upload_file_parts(file_path, client_token, upload_info, file_map, map_attempted=True)
+                    
+                    # Complete upload
+                    completion_info = self.complete_upload(upload_id, resource_name, parts)
+                    
+                    # Generate file URL
+                    file_url = f"{self.base_url}/file/{resource_name}"
+                    
+                    elapsed_time = time.time() - start_time
+                    print(f"\n✅ Upload successful!")
+                    print(f"Resource name: {resource_name}")
+                    print(f"File URL: {file_url}")
+                    print(f"ETag: {completion_info['etag']}")
+                    print(f"Size: {completion_info['size']} bytes")
+                    print(f"Upload time: {elapsed_time:.2f} seconds")
+                    print(f"Average speed: {(file_size / elapsed_time) / (1024*1024):.2f} MB/s")
+                    
+                    return file_url
+                    
+                except Exception as e:
+                    print(f"Error: {e}")
+                    self.abort_upload(upload_id, resource_name)
+                    raise
+            finally:
+                if file_map is not None:
+                    file_map.close()
                 
         except UploadError:
             raise
@@ -243,7 +651,9 @@ def create_sample_config():
     """Create a sample configuration file"""
     config = {
         "worker_url": "http://localhost:8787",
-        "jwt_secret": "your-jwt-secret-here"
+        "jwt_secret": "your-jwt-secret-here",
+        "concurrency": DEFAULT_CONCURRENCY,
+        "part_checksums": True
     }
     
     with open(CONFIG_FILE, 'w') as f:
@@ -269,8 +679,8 @@ def main():
         sys.exit(1)
     
     try:
-        uploader = MultipartUploader()
-        file_url = uploader.upload_file(file_path, resource_name)
+        with MultipartUploader() as uploader:
+            file_url = uploader.upload_file(file_path, resource_name)
         print(f"\n🔗 Your file is available at: {file_url}")
         
     except UploadError as e:
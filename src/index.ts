@@ -146,28 +146,65 @@ const clientAuth = async (
 // Utilities
 const CHUNK_SIZE = 5 * 1024 * 1024; // 5MB
 const KV_PREFIX = "upload_progress:";
+const UPLOAD_PROGRESS_TTL = 60 * 60 * 3; // Outlives the 2 hour client token
 
+interface UploadedPartMetadata {
+  bytes: number;
+}
+
+// Each uploaded part is recorded under its own key, so parts can arrive
+// concurrently and in any order without racing on a shared counter
+async function listUploadedParts(
+  kv: KVNamespace,
+  uploadId: string
+): Promise<KVNamespaceListKey<UploadedPartMetadata>[]> {
+  const keys: KVNamespaceListKey<UploadedPartMetadata>[] = [];
+  let cursor: string | undefined;
+  do {
+    const page = await kv.list<UploadedPartMetadata>({
+      prefix: `${KV_PREFIX}${uploadId}:`,
+      cursor,
+    });
+    keys.push(...page.keys);
+    cursor = page.list_complete ? undefined : page.cursor;
+  } while (cursor);
+  return keys;
+}
+
+// KV listings are eventually consistent, so this may briefly lag behind
 async function getUploadProgress(
   kv: KVNamespace,
   uploadId: string
 ): Promise<number> {
-  const progress = await kv.get(`${KV_PREFIX}${uploadId}`);
-  return progress ? parseInt(progress) : 0;
+  const parts = await listUploadedParts(kv, uploadId);
+  return parts.reduce((total, part) => total + (part.metadata?.bytes ?? 0), 0);
 }
 
-async function updateUploadProgress(
+async function recordUploadedPart(
   kv: KVNamespace,
   uploadId: string,
+  partNumber: number,
   bytes: number
 ): Promise<void> {
-  await kv.put(`${KV_PREFIX}${uploadId}`, bytes.toString());
+  await kv.put(`${KV_PREFIX}${uploadId}:${partNumber}`, bytes.toString(), {
+    metadata: { bytes },
+    expirationTtl: UPLOAD_PROGRESS_TTL,
+  });
 }
 
 async function deleteUploadProgress(
   kv: KVNamespace,
   uploadId: string
 ): Promise<void> {
-  await kv.delete(`${KV_PREFIX}${uploadId}`);
+  const parts = await listUploadedParts(kv, uploadId);
+  await Promise.all(parts.map((part) => kv.delete(part.name)));
+}
+
+async function sha256Hex(data: ArrayBuffer): Promise<string> {
+  const digest = await crypto.subtle.digest("SHA-256", data);
+  return [...new Uint8Array(digest)]
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
 }
 
 // Backend routes (with backend JWT)
@@ -205,9 +242,6 @@ app.post(
         c.env.JWT_SECRET
       );
 
-      // Initialize progress in KV
-      await updateUploadProgress(c.env.KV, multipartUpload.uploadId, 0);
-
       return c.json({
         success: true,
         uploadId: multipartUpload.uploadId,
@@ -359,6 +393,15 @@ app.put("/upload/part/:partNumber", clientAuth, async (c) => {
       );
     }
 
+    const totalParts = Math.ceil(payload.maxFileSize / CHUNK_SIZE);
+    if (
+      !Number.isInteger(partNumber) ||
+      partNumber < 1 ||
+      partNumber > totalParts
+    ) {
+      return c.json({ success: false, error: "Invalid part number" }, 400);
+    }
+
     const body = await c.req.arrayBuffer();
 
     if (!body || body.byteLength === 0) {
@@ -377,15 +420,32 @@ app.put("/upload/part/:partNumber", clientAuth, async (c) => {
       );
     }
 
-    // Verify current progress
-    const currentProgress = await getUploadProgress(c.env.KV, payload.uploadId);
-    const expectedBytes = (partNumber - 1) * CHUNK_SIZE;
+    // Verify the part checksum, when the client sent one. A mismatch means the
+    // bytes were damaged in transit, so answer 422 (which clients retry), not 400
+    const expectedChecksum = c.req.header("X-Content-SHA256");
+    if (
+      expectedChecksum &&
+      expectedChecksum.toLowerCase() !== (await sha256Hex(body))
+    ) {
+      return c.json(
+        {
+          success: false,
+          error: "Checksum mismatch",
+        },
+        422
+      );
+    }
 
-    if (currentProgress !== expectedBytes) {
+    // Parts may arrive in any order, but each must cover exactly its slice of the file
+    const expectedSize = Math.min(
+      CHUNK_SIZE,
+      payload.maxFileSize - (partNumber - 1) * CHUNK_SIZE
+    );
+    if (body.byteLength !== expectedSize) {
       return c.json(
         {
           success: false,
-          error: "Invalid part sequence",
+          error: `Part ${partNumber} must be ${expectedSize} bytes`,
         },
         400
       );
@@ -400,14 +460,19 @@ app.put("/upload/part/:partNumber", clientAuth, async (c) => {
     const uploadedPart = await multipartUpload.uploadPart(partNumber, body);
 
     // Update progress
-    const newProgress = currentProgress + body.byteLength;
-    await updateUploadProgress(c.env.KV, payload.uploadId, newProgress);
+    await recordUploadedPart(
+      c.env.KV,
+      payload.uploadId,
+      partNumber,
+      body.byteLength
+    );
+    const uploadedBytes = await getUploadProgress(c.env.KV, payload.uploadId);
 
     return c.json({
       success: true,
       partNumber: uploadedPart.partNumber,
       etag: uploadedPart.etag,
-      uploadedBytes: newProgress,
+      uploadedBytes,
       totalBytes: payload.maxFileSize,
     });
   } catch (error: any) {